@@ -14,3 +14,4 @@ GENERATION_MODEL = 'gemini-1.5-flash'
 # Search Configuration
 TOP_K_RESULTS = 10  # Increased to get more results
 SIMILARITY_THRESHOLD = 0.3  # Lowered threshold to get more results
+NORMALIZED_TOP_K_RESULTS = 5  # Marathi queries normalized to English need fewer results
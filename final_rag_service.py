@@ -310,8 +310,20 @@ Answer in a natural, conversational way with bullet points and line breaks:"""
                     'language': query_language
                 }
             
+            # Normalize Marathi queries to English for the English embedding model
+            retrieval_query = user_question
+            top_k = 10  # Increased from default
+            if query_language == 'marathi':
+                normalized_query, matched_terms, transliterated_terms = language_detector.normalize_query(user_question)
+                if matched_terms:
+                    print(f"🔤 Normalized query: {normalized_query}")
+                    retrieval_query = normalized_query
+                    # Only narrow the search when every word was translated
+                    if not transliterated_terms:
+                        top_k = config.NORMALIZED_TOP_K_RESULTS
+            
             # Perform semantic search with MORE results
-            context_docs = self.semantic_search(user_question, top_k=10)  # Increased from default
+            context_docs = self.semantic_search(retrieval_query, top_k=top_k)
             
             # Generate response with language awareness
             if context_docs:
@@ -5,16 +5,106 @@ Detects English vs Marathi and provides appropriate responses
 """
 
 import re
-from typing import Tuple, Dict, Any
+from functools import lru_cache
+from typing import Tuple, Dict, Any, List
 
 class LanguageDetector:
     def __init__(self):
         """Initialize the language detector"""
+        # Marathi place names and their English spellings
+        self.marathi_place_names = {
+            'महाराष्ट्र': 'maharashtra', 'पुणे': 'pune', 'मुंबई': 'mumbai', 'नागपूर': 'nagpur',
+            'औरंगाबाद': 'chhatrapati sambhajinagar', 'कोल्हापूर': 'kolhapur', 'सांगली': 'sangli', 'नाशिक': 'nashik',
+            'अमरावती': 'amravati', 'चंद्रपूर': 'chandrapur', 'सोलापूर': 'solapur', 'धुळे': 'dhule',
+            'अहमदनगर': 'ahilyanagar', 'अहिल्यानगर': 'ahilyanagar', 'लातूर': 'latur', 'बीड': 'beed', 'जालना': 'jalna',
+            'परभणी': 'parbhani', 'नांदेड': 'nanded', 'यवतमाळ': 'yavatmal', 'गडचिरोली': 'gadchiroli',
+            'वर्धा': 'wardha', 'बुलढाणा': 'buldhana', 'अकोला': 'akola', 'वाशीम': 'washim',
+            'संभाजीनगर': 'chhatrapati sambhajinagar'
+        }
+
+        # Common English-Marathi term translations
+        self.common_translations = {
+            'plots': 'प्लॉट',
+            'commercial': 'व्यावसायिक',
+            'industrial': 'औद्योगिक', 
+            'residential': 'निवासी',
+            'available': 'उपलब्ध',
+            'price': 'किंमत',
+            'rate': 'दर',
+            'location': 'स्थान',
+            'pune': 'पुणे',
+            'mumbai': 'मुंबई',
+            'square meter': 'चौरस मीटर',
+            'rupees': 'रुपये',
+            'lakh': 'लाख',
+            'crore': 'कोटी'
+        }
+
+        # Extra Marathi spellings used only for query normalization
+        self.marathi_query_aliases = {
+            'मिडक': 'midc',
+            'एमआयडीसी': 'midc',
+            'कॉमर्शियल': 'commercial',
+            'इंडस्ट्रियल': 'industrial',
+            'रेजिडेंशियल': 'residential',
+            'जमीन': 'land',
+            'एकर': 'acre',
+            'हेक्टर': 'hectare',
+            # Oblique stems of place names (e.g. "पुण्यात", "नागपुरात")
+            'पुण्या': 'pune',
+            'नागपुर': 'nagpur',
+            'कोल्हापुर': 'kolhapur',
+            'सोलापुर': 'solapur',
+            'चंद्रपुर': 'chandrapur',
+            'लातुर': 'latur',
+            'धुळ्या': 'dhule',
+            'अकोल्या': 'akola',
+            'वर्ध्या': 'wardha',
+            'जालन्या': 'jalna',
+            'बुलढाण्या': 'buldhana'
+        }
+
+        # Case suffixes that may follow a matched term within the same word (and may be chained)
+        self.marathi_case_suffixes = {
+            'मध्ये', 'मधे', 'मधील', 'मधून', 'ची', 'चे', 'चा', 'च्या', 'त', 'ात', 'ांत',
+            'तील', 'ातील', 'ेत', 'एत', 'साठी', 'जवळ', 'वर', 'कडे', 'पर्यंत', 'ां',
+            'ला', 'ाला', 'ना', 'ांना', 'ने', 'ाने', 'ून', 'हून', '्स'
+        }
+
+        # Marathi function words that carry no retrieval meaning on their own
+        self.marathi_stopwords = {
+            'मध्ये', 'मधे', 'मधील', 'मधून', 'साठी', 'जवळ', 'वर', 'कडे', 'पर्यंत',
+            'चा', 'ची', 'चे', 'च्या', 'ला', 'ना', 'ने', 'आणि', 'किंवा', 'व', 'या', 'हे', 'ते',
+            'मला', 'आम्हाला', 'मी', 'तुम्ही', 'कृपया', 'सर्व', 'फक्त', 'नाही', 'एक',
+            'हवे', 'हवा', 'हवी', 'हव्या', 'पाहिजे', 'आहे', 'आहेत', 'असेल', 'होईल', 'मिळेल', 'मिळतील',
+            'काय', 'कसे', 'कशी', 'कुठे', 'केव्हा', 'कोण', 'का', 'किती', 'कुठून', 'कुठेपर्यंत',
+            'कशाला', 'कशासाठी', 'कोणते', 'कोणत्या', 'दे', 'द्या', 'सांग', 'सांगा',
+            'कर', 'करा', 'पाह', 'पाहा', 'दाखव', 'दाखवा', 'माहिती', 'तपशील'
+        }
+
+        # Devanagari to Latin transliteration for words not in the dictionary
+        self.devanagari_vowels = {
+            'अ': 'a', 'आ': 'a', 'इ': 'i', 'ई': 'i', 'उ': 'u', 'ऊ': 'u', 'ऋ': 'ru',
+            'ए': 'e', 'ऐ': 'ai', 'ओ': 'o', 'औ': 'au', 'ऑ': 'o', 'ॲ': 'a',
+            'ं': 'n', 'ँ': 'n', 'ः': 'h'
+        }
+        self.devanagari_vowel_signs = {
+            'ा': 'a', 'ि': 'i', 'ी': 'i', 'ु': 'u', 'ू': 'u', 'ृ': 'ru',
+            'े': 'e', 'ै': 'ai', 'ो': 'o', 'ौ': 'au', 'ॉ': 'o', 'ॅ': 'e'
+        }
+        self.devanagari_consonants = {
+            'क': 'k', 'ख': 'kh', 'ग': 'g', 'घ': 'gh', 'ङ': 'n', 'च': 'ch', 'छ': 'chh',
+            'ज': 'j', 'झ': 'jh', 'ञ': 'n', 'ट': 't', 'ठ': 'th', 'ड': 'd', 'ढ': 'dh',
+            'ण': 'n', 'त': 't', 'थ': 'th', 'द': 'd', 'ध': 'dh', 'न': 'n', 'प': 'p',
+            'फ': 'ph', 'ब': 'b', 'भ': 'bh', 'म': 'm', 'य': 'y', 'र': 'r', 'ल': 'l',
+            'ळ': 'l', 'व': 'v', 'श': 'sh', 'ष': 'sh', 'स': 's', 'ह': 'h'
+        }
+
         # Common Marathi words and patterns
         self.marathi_patterns = [
             # Common Marathi words
             r'\b(प्लॉट|जमीन|भूमि|मालमत्ता|विक्री|भाडे|किंमत|दर|स्थान|ठिकाण|मिळेल|उपलब्ध|कशी|कुठे|केव्हा|कोण|काय|का|कसे|किती|कुठून|कुठेपर्यंत)\b',
-            r'\b(महाराष्ट्र|पुणे|मुंबई|नागपूर|औरंगाबाद|कोल्हापूर|सांगली|नाशिक|अमरावती|चंद्रपूर|सोलापूर|धुळे|अहमदनगर|लातूर|बीड|जालना|परभणी|नांदेड|यवतमाळ|गडचिरोली|वर्धा|बुलढाणा|अकोला|वाशीम|अमरावती)\b',
+            r'\b(' + '|'.join(self.marathi_place_names) + r')\b',
             r'\b(मिडक|एमआयडीसी|व्यावसायिक|औद्योगिक|निवासी|कॉमर्शियल|इंडस्ट्रियल|रेजिडेंशियल)\b',
             r'\b(चौरस|मीटर|हेक्टर|एकर|स्क्वेअर|फूट|यार्ड|किमी|मी|सेमी)\b',
             r'\b(रुपये|रुपयां|रू|₹|लाख|कोटी|हजार|शेकडो)\b',
@@ -36,6 +126,135 @@ class LanguageDetector:
             'help', 'information', 'details', 'what', 'how', 'where', 'when', 'which', 'why'
         }
 
+        # Compile the Marathi-to-English query trie and memoize normalization
+        # (danda/double danda are punctuation; ZWJ/ZWNJ are dropped before matching)
+        self.token_regex = re.compile(r'[\u0900-\u0963\u0966-\u097F\w]+', re.UNICODE)
+        self.query_char_map = str.maketrans('०१२३४५६७८९', '0123456789', '\u200c\u200d')
+        self.query_trie = self._build_query_trie()
+        self.suffix_trie = self._build_trie({suffix: True for suffix in self.marathi_case_suffixes})
+        self.normalize_query = lru_cache(maxsize=1024)(self._normalize_query)
+
+    def _build_query_trie(self) -> Dict[str, Any]:
+        """Build a character trie mapping Marathi terms to English retrieval terms"""
+        entries = {mar: eng for eng, mar in self.common_translations.items()}
+        entries.update(self.marathi_place_names)
+        entries.update(self.marathi_query_aliases)
+        return self._build_trie(entries)
+
+    def _build_trie(self, entries: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a character trie whose terminal nodes store the entry value under None"""
+        trie = {}
+        for marathi, english in entries.items():
+            node = trie
+            for char in marathi:
+                node = node.setdefault(char, {})
+            node[None] = english
+        return trie
+
+    def _trie_matches(self, text: str, start: int) -> List[Tuple[int, str]]:
+        """Return (end position, English term) for every trie match at start, shortest first"""
+        node = self.query_trie
+        matches = []
+        for pos in range(start, len(text)):
+            node = node.get(text[pos])
+            if node is None:
+                break
+            if None in node:
+                matches.append((pos + 1, node[None]))
+        return matches
+
+    def _is_suffix_chain(self, text: str, start: int = 0) -> bool:
+        """Check whether text[start:] is entirely made of known case suffixes"""
+        if start == len(text):
+            return True
+        node = self.suffix_trie
+        for pos in range(start, len(text)):
+            node = node.get(text[pos])
+            if node is None:
+                return False
+            if None in node and self._is_suffix_chain(text, pos + 1):
+                return True
+        return False
+
+    def _match_term(self, text: str, start: int) -> Tuple[int, str]:
+        """
+        Return the word end position and English term of the longest trie match at start.
+        A match is only accepted when it ends the word or is followed by known case suffixes.
+        """
+        for match_end, term in reversed(self._trie_matches(text, start)):
+            rest = self.token_regex.match(text, match_end)
+            if not rest:
+                return match_end, term
+            if self._is_suffix_chain(rest.group()):
+                return rest.end(), term
+        return start, ''
+
+    def _strip_suffixes(self, word: str) -> str:
+        """Strip the longest trailing case suffix chain, keeping a stem of at least three characters"""
+        for pos in range(3, len(word)):
+            if self._is_suffix_chain(word, pos):
+                return word[:pos]
+        return word
+
+    def _transliterate(self, word: str) -> str:
+        """Transliterate a Devanagari word to Latin script, dropping the final inherent vowel"""
+        result = []
+        pending_vowel = False
+        for char in word:
+            if char in self.devanagari_vowel_signs:
+                result.append(self.devanagari_vowel_signs[char])
+                pending_vowel = False
+            elif char == '्':
+                pending_vowel = False
+            elif char == '़':
+                continue
+            else:
+                if pending_vowel:
+                    result.append('a')
+                pending_vowel = char in self.devanagari_consonants
+                result.append(self.devanagari_consonants.get(char) or self.devanagari_vowels.get(char)
+                              or (char if char.isascii() else ''))
+        return ''.join(result)
+
+    def _normalize_query(self, text: str) -> Tuple[str, int, int]:
+        """
+        Convert a Marathi query into a canonical English retrieval query.
+        Known terms are matched longest-first (case suffixes are dropped), Latin words
+        and numbers are kept, Marathi function words are discarded, and other Marathi
+        words (e.g. industrial area names) are transliterated so they are not lost.
+        Returns the query, the number of dictionary terms matched and the number of
+        transliterated words.
+        """
+        text = ' '.join(text.lower().translate(self.query_char_map).split())
+        terms = []
+        matched_count = 0
+        transliterated_count = 0
+        pos = 0
+        while pos < len(text):
+            token = self.token_regex.match(text, pos)
+            if not token:
+                pos += 1
+                continue
+
+            word_end, term = self._match_term(text, pos)
+            if term:
+                matched_count += 1
+                pos = word_end
+            else:
+                word = token.group()
+                pos = token.end()
+                if word.isascii():
+                    term = word
+                elif word not in self.marathi_stopwords:
+                    term = self._transliterate(self._strip_suffixes(word))
+                    if term:
+                        transliterated_count += 1
+
+            if term and term not in terms:
+                terms.append(term)
+
+        return ' '.join(terms), matched_count, transliterated_count
+
     def detect_language(self, text: str) -> str:
         """
         Detect if the text is in English or Marathi
@@ -134,26 +353,8 @@ Keep the response in English and use simple, clear language.
         if from_lang == to_lang:
             return text
         
-        # Common translations
-        translations = {
-            'plots': 'प्लॉट',
-            'commercial': 'व्यावसायिक',
-            'industrial': 'औद्योगिक', 
-            'residential': 'निवासी',
-            'available': 'उपलब्ध',
-            'price': 'किंमत',
-            'rate': 'दर',
-            'location': 'स्थान',
-            'pune': 'पुणे',
-            'mumbai': 'मुंबई',
-            'square meter': 'चौरस मीटर',
-            'rupees': 'रुपये',
-            'lakh': 'लाख',
-            'crore': 'कोटी'
-        }
-        
         result = text
-        for eng, mar in translations.items():
+        for eng, mar in self.common_translations.items():
             if from_lang == 'english' and to_lang == 'marathi':
                 result = result.replace(eng, mar)
             elif from_lang == 'marathi' and to_lang == 'english':
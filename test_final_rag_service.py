@@ -0,0 +1,43 @@
+import pytest
+
+pytest.importorskip('numpy')
+pytest.importorskip('pinecone')
+pytest.importorskip('sentence_transformers')
+pytest.importorskip('google.generativeai')
+
+import config
+from final_rag_service import RAGService
+
+
+@pytest.fixture
+def searches(monkeypatch):
+    """RAGService without external services that records semantic_search calls"""
+    calls = []
+    rag = RAGService.__new__(RAGService)
+    monkeypatch.setattr(rag, 'semantic_search', lambda query, top_k=None: calls.append((query, top_k)) or [])
+    monkeypatch.setattr(rag, 'generate_response', lambda query, context_docs, language='english': '')
+    return rag, calls
+
+
+def test_query_marathi_uses_normalized_query(searches):
+    rag, calls = searches
+    rag.query('पुणे मध्ये व्यावसायिक प्लॉट दाखवा')
+    assert calls == [('pune commercial plots', config.NORMALIZED_TOP_K_RESULTS)]
+
+
+def test_query_marathi_with_unknown_area_keeps_default_top_k(searches):
+    rag, calls = searches
+    rag.query('चाकण मध्ये औद्योगिक प्लॉट')
+    assert calls == [('chakan industrial plots', 10)]
+
+
+def test_query_english_is_unchanged(searches):
+    rag, calls = searches
+    rag.query('industrial plots in pune')
+    assert calls == [('industrial plots in pune', 10)]
+
+
+def test_query_marathi_without_dictionary_match_falls_back(searches):
+    rag, calls = searches
+    rag.query('शिर्डी कुठे आहे')
+    assert calls == [('शिर्डी कुठे आहे', 10)]
@@ -0,0 +1,52 @@
+from language_detector import LanguageDetector
+
+
+detector = LanguageDetector()
+
+
+def test_normalize_sample_query():
+    assert detector.normalize_query('पुणे मध्ये व्यावसायिक प्लॉट दाखवा') == ('pune commercial plots', 3, 0)
+
+
+def test_normalize_inflected_place_name():
+    assert detector.normalize_query('MIDC पुण्यात प्लॉट्स') == ('midc pune plots', 2, 0)
+    assert detector.normalize_query('नागपुरात प्लॉटची किंमत') == ('nagpur plots price', 3, 0)
+    assert detector.normalize_query('औरंगाबादेत') == ('chhatrapati sambhajinagar', 1, 0)
+
+
+def test_normalize_til_sathi_and_chained_suffixes():
+    assert detector.normalize_query('पुण्यातील औद्योगिक प्लॉट') == ('pune industrial plots', 3, 0)
+    assert detector.normalize_query('मुंबईतील व्यावसायिक प्लॉट') == ('mumbai commercial plots', 3, 0)
+    assert detector.normalize_query('नाशिकसाठी प्लॉट') == ('nashik plots', 2, 0)
+    assert detector.normalize_query('पुण्याजवळ प्लॉटवर') == ('pune plots', 2, 0)
+    assert detector.normalize_query('प्लॉट्सची किंमत') == ('plots price', 2, 0)
+
+
+def test_normalize_rejects_unrelated_prefix_match():
+    assert detector.normalize_query('दरम्यान पुणे प्लॉट') == ('daramyan pune plots', 2, 1)
+    assert detector.normalize_query('दरवाजा') == ('daravaja', 0, 1)
+
+
+def test_normalize_keeps_unknown_area_names():
+    assert detector.normalize_query('चाकण मध्ये औद्योगिक प्लॉट') == ('chakan industrial plots', 2, 1)
+    assert detector.normalize_query('शिर्डी साठी प्लॉट') == ('shirdi plots', 1, 1)
+    assert detector.normalize_query('सुपामधील प्लॉट') == ('supa plots', 1, 1)
+
+
+def test_normalize_uses_indexed_office_names():
+    assert detector.normalize_query('अहमदनगर प्लॉट') == ('ahilyanagar plots', 2, 0)
+    assert detector.normalize_query('अहिल्यानगर प्लॉट') == ('ahilyanagar plots', 2, 0)
+
+
+def test_normalize_handles_danda_and_joiners():
+    assert detector.normalize_query('पुणे।') == ('pune', 1, 0)
+    assert detector.normalize_query('पु‍णे प्लॉ‌ट') == ('pune plots', 2, 0)
+
+
+def test_normalize_converts_devanagari_digits():
+    assert detector.normalize_query('५ एकर जमीन नाशिक') == ('5 acre land nashik', 3, 0)
+
+
+def test_normalize_reports_no_matches_for_fallback():
+    assert detector.normalize_query('MIDC कुठे आहे') == ('midc', 0, 0)
+    assert detector.normalize_query('नमस्कार')[1] == 0